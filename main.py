@@ -4,14 +4,21 @@ Simple JSON CV - Generate professional PDF resumes from JSON data
 """
 
 import json
+import glob
 import os
 import sys
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+import atexit
+import signal
 import base64
 import asyncio
+import hashlib
+import re
 
 # Load environment variables from .env file
 try:
@@ -21,7 +28,20 @@ except ImportError:
     # dotenv is optional, continue without it
     print("Warning: dotenv is not installed. Please install it with: pip install python-dotenv")
 
-from jinja2 import Environment, FileSystemLoader
+# uvloop is optional; when installed, the shared event loop runs on libuv
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# orjson is optional; it parses straight from bytes and is faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from markupsafe import Markup
 from dateutil import parser
 
 # Import pyppeteer for PDF generation
@@ -36,9 +56,185 @@ except ImportError:
     print("Error: Pyppeteer is required for PDF generation. Install it with: pip install pyppeteer")
     sys.exit(1)
 
+# Playwright is an optional alternative PDF backend
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+PDF_BACKENDS = ('pyppeteer', 'playwright')
+
+# Compiled template code reused across runs
+JINJA_CACHE_DIR = '.jinja_cache'
+
+# Chrome profile reused across runs by the Playwright backend
+PLAYWRIGHT_USER_DATA_DIR = '.chrome-profile'
+
+# Maximum number of pages rendered concurrently by build_many
+PAGE_POOL_SIZE = 4
+
+# Contact icons are read on a thread pool once a CV has at least this many uncached ones
+PARALLEL_ICON_THRESHOLD = 4
+ICON_READ_WORKERS = 8
+
+# Chrome flags for headless CV rendering; turn off everything a static page doesn't need
+CHROME_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--mute-audio',
+]
+
+
+class _BrowserPool:
+    """Process-wide Chrome instance and event loop shared by all CV renders"""
+    _loop = None
+    _browser = None
+    _playwright = None
+    _context = None
+    _lock = None
+
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        """Return the long-lived event loop, creating it on first use"""
+        if cls._loop is None or cls._loop.is_closed():
+            cls._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            asyncio.set_event_loop(cls._loop)
+            atexit.register(cls.close)
+        return cls._loop
+
+    @classmethod
+    async def get_browser(cls):
+        """Return the shared browser, launching Chrome on first use"""
+        # Concurrent renders must not race each other into launching Chrome twice
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if cls._browser is None:
+                # The pool owns the browser's lifetime, so keep pyppeteer's own
+                # exit and signal handlers from closing it behind our back
+                cls._browser = await launch(
+                    executablePath=CHROME_EXECUTABLE_PATH,
+                    args=CHROME_ARGS,
+                    handleSIGINT=False,
+                    handleSIGTERM=False,
+                    handleSIGHUP=False,
+                    autoClose=False,
+                )
+        return cls._browser
+
+    @classmethod
+    async def get_context(cls):
+        """Return the shared Playwright persistent context, launching Chrome on first use"""
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if cls._context is None:
+                if cls._playwright is None:
+                    cls._playwright = await async_playwright().start()
+                cls._context = await cls._playwright.chromium.launch_persistent_context(
+                    PLAYWRIGHT_USER_DATA_DIR,
+                    executable_path=CHROME_EXECUTABLE_PATH,
+                    args=CHROME_ARGS,
+                )
+        return cls._context
+
+    @classmethod
+    def close(cls):
+        """Close the shared browser and its event loop"""
+        if cls._loop is None or cls._loop.is_closed():
+            return
+        try:
+            if cls._browser is not None:
+                cls._loop.run_until_complete(cls._browser.close())
+            if cls._context is not None:
+                cls._loop.run_until_complete(cls._context.close())
+            if cls._playwright is not None:
+                cls._loop.run_until_complete(cls._playwright.stop())
+        finally:
+            cls._browser = None
+            cls._context = None
+            cls._playwright = None
+            cls._lock = None
+            cls._loop.close()
+            atexit.unregister(cls.close)
+
+
+# XML declaration at the top of an SVG file, invalid once inlined into HTML
+_XML_PROLOG_RE = re.compile(r'^\s*<\?xml[^>]*\?>\s*')
+# Editor cruft that doesn't affect how an icon renders; a DOCTYPE may carry an
+# internal subset in brackets, which Illustrator exports contain
+_SVG_CRUFT_RE = re.compile(r'<!--.*?-->|<metadata\b.*?</metadata>|<!DOCTYPE[^>\[]*(?:\[.*?\])?\s*>', re.DOTALL)
+# Elements whose inner whitespace renders, so whitespace between their tags must stay
+_SVG_TEXT_BLOCK_RE = re.compile(r'(<(text|style)\b.*?</\2\s*>)', re.DOTALL)
+_SVG_INTERTAG_WS_RE = re.compile(r'>\s+<')
+_WS_RE = re.compile(r'\s+')
+
+
+def _minify_svg(svg: str) -> str:
+    """Strip the XML prolog, comments, metadata and redundant whitespace from an SVG"""
+    svg = _XML_PROLOG_RE.sub('', svg)
+    svg = _SVG_CRUFT_RE.sub('', svg)
+    # re.split with the capturing group alternates: outside, text block, tag name, outside, ...
+    # Only whitespace outside text blocks goes; at a block boundary it sits between tags too
+    parts = _SVG_TEXT_BLOCK_RE.split(svg)
+    last = len(parts) - 1
+    for i in range(0, len(parts), 3):
+        part = _SVG_INTERTAG_WS_RE.sub('><', parts[i])
+        if i > 0:
+            part = part.lstrip()
+        if i < last:
+            part = part.rstrip()
+        parts[i] = part
+    svg = ''.join(part for i, part in enumerate(parts) if i % 3 != 2)
+    return _WS_RE.sub(' ', svg).strip()
+
+
+def _fast_read(path_str: str) -> str:
+    """Read a small text file in one syscall, bypassing the buffered I/O layers"""
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size).decode('utf-8')
+    finally:
+        os.close(fd)
+
+
+# Contact icon values starting with these are file paths to embed
+_ICON_PREFIXES = ('static/icons/', 'templates/static/icons/')
+
+# Template context fields and their defaults when missing from the CV JSON
+_CV_FIELDS = (
+    ('name', ''),
+    ('position', ''),
+    ('contacts', ()),
+    ('summary', ''),
+    ('skills', ()),
+    ('education_certificates', ()),
+    ('languages', ()),
+    ('experience', ()),
+    ('cv_icon', ''),
+)
+
 
 class SimpleJSONCV:
-    def __init__(self, template_dir: str = "templates"):
+    def __init__(self, template_dir: str = "templates", backend: str = "pyppeteer"):
+        if backend not in PDF_BACKENDS:
+            print(f"Error: Unknown PDF backend '{backend}'. Choose one of: {', '.join(PDF_BACKENDS)}")
+            sys.exit(1)
+        if backend == "playwright" and not PLAYWRIGHT_AVAILABLE:
+            print("Error: Playwright backend requested but not installed. Install it with: pip install playwright")
+            sys.exit(1)
+        self.backend = backend
+        
         self.template_dir = Path(template_dir)
         self.template_dir.mkdir(exist_ok=True)
         
@@ -54,8 +250,24 @@ class SimpleJSONCV:
                 if icon_file.is_file():
                     shutil.copy2(icon_file, static_dir / icon_file.name)
         
+        # Index available icons by file name so renders resolve them without stat calls
+        self._icon_dir = static_dir
+        self._icon_index = {p.name: p for p in static_dir.rglob("*.svg")}
+        # Minified SVG content by path, so batch builds read and minify each icon once
+        self._svg_cache: Dict[str, str] = {}
+        
         # Initialize Jinja2 environment after template is created
-        self.env = Environment(loader=FileSystemLoader(str(self.template_dir)))
+        # Templates don't change during a run, so skip per-render reload checks.
+        # The bytecode cache lets later runs skip parsing and compiling the template;
+        # entries are keyed on the template source, so edits invalidate them
+        jinja_cache_dir = Path(JINJA_CACHE_DIR)
+        jinja_cache_dir.mkdir(exist_ok=True)
+        self.env = Environment(
+            loader=FileSystemLoader(str(self.template_dir)),
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=FileSystemBytecodeCache(str(jinja_cache_dir)),
+        )
         
         # Add custom filters
         def b64encode_filter(s):
@@ -63,15 +275,38 @@ class SimpleJSONCV:
                 return base64.b64encode(s.encode('utf-8')).decode('utf-8')
             return ''
         
+        def svg_data_uri_filter(s):
+            # mini-svg-data-uri encoding: encodeURIComponent, then restore the few
+            # characters that are safe in a quoted attribute; smaller than base64
+            if isinstance(s, str):
+                svg = ' '.join(s.replace('"', "'").split())
+                encoded = quote(svg, safe="-_.!~*'()")
+                for escaped, char in (('%20', ' '), ('%3D', '='), ('%3A', ':'), ('%2F', '/')):
+                    encoded = encoded.replace(escaped, char)
+                return 'data:image/svg+xml,' + encoded
+            return ''
+        
+        def raw_svg_filter(s):
+            # Inline SVG markup as-is so Chrome parses it straight into the DOM
+            if isinstance(s, str):
+                return Markup(s)
+            return ''
+        
         self.env.filters['b64encode'] = b64encode_filter
+        self.env.filters['svg_data_uri'] = svg_data_uri_filter
+        self.env.filters['raw_svg'] = raw_svg_filter
+        
+        self._template = self.env.get_template("cv_template.html")
     
  
     def load_cv_data(self, json_file: str) -> Dict[str, Any]:
         """Load CV data from JSON file"""
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data
+            with open(json_file, 'rb') as f:
+                raw = f.read()
+            if orjson is not None:
+                return orjson.loads(raw)
+            return json.loads(raw)
         except FileNotFoundError:
             print(f"Error: File '{json_file}' not found.")
             sys.exit(1)
@@ -81,42 +316,42 @@ class SimpleJSONCV:
     
     def generate_html(self, cv_data: Dict[str, Any]) -> str:
         """Generate HTML from CV data using Jinja2 template"""
-        template = self.env.get_template("cv_template.html")
-        
-        # Separate education and certificates
-        education_certificates = []
-        certificates = []
-        
-        for item in cv_data.get('education_certificates', []):
-            education_certificates.append(item)
-        # Prepare template context
-        context = {
-            'name': cv_data.get('name', ''),
-            'position': cv_data.get('position', ''),
-            'contacts': cv_data.get('contacts', []),
-            'summary': cv_data.get('summary', ''),
-            'skills': cv_data.get('skills', []),
-            'education_certificates': education_certificates,
-            'languages': cv_data.get('languages', []),
-            'experience': cv_data.get('experience', []),
-            'cv_icon': cv_data.get('cv_icon', '')
-        }
-        
-        
-        return template.render(**context)
+        return self._template.render(**{key: cv_data.get(key, default) for key, default in _CV_FIELDS})
     
-    async def generate_pdf_pyppeteer(self, html_file_path: str, output_file: str):
+    async def generate_pdf_pyppeteer(self, html_content: str, output_file: str):
         """Convert HTML to PDF using Pyppeteer (Chrome headless)"""
         try:
-            browser = await launch(executablePath=CHROME_EXECUTABLE_PATH)
+            browser = await _BrowserPool.get_browser()
             page = await browser.newPage()
+            try:
+                # Icons are inlined, so the HTML can be loaded straight from memory.
+                # setContent doesn't wait for subresources, so wait for the load state:
+                # the template imports its web font, and DOMContentLoaded fires before
+                # that stylesheet arrives, which would print with the fallback font
+                await page.setContent(html_content)
+                await page.waitForFunction("document.readyState === 'complete'")
+                
+                await page.pdf({'path': output_file, 'format': 'A4'})
+            finally:
+                await page.close()
             
-            # Convert file path to file:// URL
-            file_url = f"file://{Path(html_file_path).absolute()}"
-            await page.goto(file_url)
-            
-            await page.pdf({'path': output_file, 'format': 'A4'})
-            await browser.close()
+            print(f"PDF generated successfully: {output_file}")
+            return True
+        except Exception as e:
+            print(f"Error generating PDF: {e}")
+            return False
+    
+    async def generate_pdf_playwright(self, html_content: str, output_file: str):
+        """Convert HTML to PDF using Playwright (Chrome headless, persistent profile)"""
+        try:
+            context = await _BrowserPool.get_context()
+            page = await context.new_page()
+            try:
+                # Wait for 'load', not 'domcontentloaded', so the web font is in place
+                await page.set_content(html_content, wait_until='load')
+                await page.pdf(path=output_file, format='A4')
+            finally:
+                await page.close()
             
             print(f"PDF generated successfully: {output_file}")
             return True
@@ -124,22 +359,24 @@ class SimpleJSONCV:
             print(f"Error generating PDF: {e}")
             return False
     
+    def _generate_pdf_async(self, html_content: str, output_file: str):
+        """Return the PDF rendering coroutine for the configured backend"""
+        if self.backend == "playwright":
+            return self.generate_pdf_playwright(html_content, output_file)
+        return self.generate_pdf_pyppeteer(html_content, output_file)
+    
+    async def _render_one(self, html_content: str, pdf_path: str, sem: asyncio.Semaphore) -> bool:
+        """Render a single HTML document to PDF, bounded by the page pool semaphore"""
+        async with sem:
+            return await self._generate_pdf_async(html_content, pdf_path)
+    
     def generate_pdf(self, html_content: str, output_file: str):
-        """Convert HTML to PDF using Pyppeteer"""
-        # Save HTML to temporary file for Pyppeteer
-        html_file = output_file.replace('.pdf', '.html')
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # Run Pyppeteer in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            success = loop.run_until_complete(self.generate_pdf_pyppeteer(html_file, output_file))
-            if not success:
-                sys.exit(1)
-        finally:
-            loop.close()
+        """Convert HTML to PDF using the configured backend"""
+        # Run the backend in the shared event loop
+        loop = _BrowserPool.get_loop()
+        success = loop.run_until_complete(self._generate_pdf_async(html_content, output_file))
+        if not success:
+            sys.exit(1)
 
 
     def build_cv(self, json_file: str, output_file_name: str = None):
@@ -156,69 +393,146 @@ class SimpleJSONCV:
         print("Generating HTML...")
         html_content = self.generate_html(cv_data)
         
-        if not os.path.exists(output_file_name):
-            os.makedirs(os.path.dirname(output_file_name))
-            
+        Path(output_file_name).parent.mkdir(parents=True, exist_ok=True)
+        
+        render_key = self._render_key(html_content)
+        if self._is_up_to_date(output_file_name, render_key):
+            print(f"{output_file_name}.pdf is up to date, skipping PDF generation")
+            print("CV generation completed!")
+            return
+        
+        # Drop the old key first so a failed render can't leave outputs marked up to date
+        Path(output_file_name + ".key").unlink(missing_ok=True)
+        
         # Save HTML to output file
         with open(output_file_name + ".html", "w", encoding="utf-8") as f:
             f.write(html_content)
                 
         print("Converting to PDF...")
         self.generate_pdf(html_content, output_file_name + ".pdf")
+        self._save_render_key(output_file_name, render_key)
         
         print("CV generation completed!")
 
+    async def build_many(self, json_files: List[str], outputs: List[str]) -> bool:
+        """Build several CVs, rendering their PDFs concurrently in the shared browser"""
+        pending = []
+        for json_file, output_file_name in zip(json_files, outputs):
+            print(f"Loading CV data from {json_file}...")
+            cv_data = self._embed_svg_icons(self.load_cv_data(json_file))
+            
+            print(f"Generating HTML for {json_file}...")
+            html_content = self.generate_html(cv_data)
+            
+            Path(output_file_name).parent.mkdir(parents=True, exist_ok=True)
+            
+            render_key = self._render_key(html_content)
+            if self._is_up_to_date(output_file_name, render_key):
+                print(f"{output_file_name}.pdf is up to date, skipping PDF generation")
+                continue
+            
+            # Drop the old key first so a failed render can't leave outputs marked up to date
+            Path(output_file_name + ".key").unlink(missing_ok=True)
+            with open(output_file_name + ".html", "w", encoding="utf-8") as f:
+                f.write(html_content)
+            pending.append((html_content, output_file_name, render_key))
+        
+        print(f"Converting {len(pending)} CVs to PDF...")
+        sem = asyncio.Semaphore(PAGE_POOL_SIZE)
+        results = await asyncio.gather(*[
+            self._render_one(html_content, output_file_name + ".pdf", sem)
+            for html_content, output_file_name, _ in pending
+        ])
+        for (_, output_file_name, render_key), success in zip(pending, results):
+            if success:
+                self._save_render_key(output_file_name, render_key)
+        
+        print("CV generation completed!")
+        return all(results)
+
+    def _render_key(self, html_content: str) -> str:
+        """Hash everything that determines the PDF: the rendered HTML and the backend"""
+        return hashlib.blake2b(f"{self.backend}\0{html_content}".encode('utf-8')).hexdigest()
+
+    def _is_up_to_date(self, output_file_name: str, render_key: str) -> bool:
+        """Check whether the existing HTML and PDF outputs were built from identical input"""
+        try:
+            return (Path(output_file_name + ".pdf").exists()
+                    and Path(output_file_name + ".html").exists()
+                    and Path(output_file_name + ".key").read_text(encoding='utf-8') == render_key)
+        except OSError:
+            return False
+
+    def _save_render_key(self, output_file_name: str, render_key: str):
+        """Record the input hash next to a freshly rendered PDF"""
+        Path(output_file_name + ".key").write_text(render_key, encoding='utf-8')
+
+    def close(self):
+        """Shut down the shared browser and event loop once all CVs are built"""
+        _BrowserPool.close()
+
+    def _read_svg(self, path_str: str) -> str:
+        """Read and minify an SVG file for inlining, cached per path"""
+        svg = self._svg_cache.get(path_str)
+        if svg is None:
+            svg = self._svg_cache[path_str] = _minify_svg(_fast_read(path_str))
+        return svg
+
+    def _resolve_and_read(self, contact: dict) -> Tuple[Optional[Path], Optional[str], Optional[Exception]]:
+        """Resolve a contact's icon and read it, returning (path, content, error)"""
+        svg_path = self._icon_index.get(Path(contact['icon']).name)
+        if svg_path is None:
+            return None, None, None
+        try:
+            return svg_path, self._read_svg(str(svg_path)), None
+        except Exception as e:
+            return svg_path, None, e
+
     def _embed_svg_icons(self, cv_data: dict) -> dict:
         """Read SVG files and embed their content directly into the CV data"""
         # Embed CV icon
-        cv_icon_path = Path("templates/static/icons/cv.svg")
-        if cv_icon_path.exists():
+        cv_icon_path = self._icon_index.get("cv.svg")
+        if cv_icon_path:
             try:
-                with open(cv_icon_path, 'r', encoding='utf-8') as f:
-                    cv_icon_content = f.read().strip()
-                cv_data['cv_icon'] = cv_icon_content
+                cv_data['cv_icon'] = self._read_svg(str(cv_icon_path))
                 print(f"Embedded CV icon: {cv_icon_path.name}")
             except Exception as e:
                 print(f"Warning: Could not read CV icon file: {e}")
                 cv_data['cv_icon'] = ""
         else:
-            print(f"Warning: CV icon file not found: {cv_icon_path}")
+            print(f"Warning: CV icon file not found: {self._icon_dir / 'cv.svg'}")
             cv_data['cv_icon'] = ""
         
         # Embed contact icons
         if 'contacts' in cv_data:
-            for contact in cv_data['contacts']:
-                if 'icon' in contact and contact['icon']:
-                    # Check if icon is a file path
-                    if contact['icon'].startswith('static/icons/') or contact['icon'].startswith('templates/static/icons/'):
-                        # Try to read the SVG file
-                        svg_path = Path(contact['icon'])
-                        if not svg_path.exists():
-                            # Try alternative paths
-                            alt_paths = [
-                                Path(contact['icon']),
-                                Path("static/icons") / Path(contact['icon']).name,
-                                Path("templates/static/icons") / Path(contact['icon']).name
-                            ]
-                            
-                            svg_path = None
-                            for path in alt_paths:
-                                if path.exists():
-                                    svg_path = path
-                                    break
-                        
-                        if svg_path and svg_path.exists():
-                            try:
-                                with open(svg_path, 'r', encoding='utf-8') as f:
-                                    svg_content = f.read().strip()
-                                # Replace the icon path with the actual SVG content
-                                contact['icon'] = svg_content
-                                print(f"Embedded SVG icon: {svg_path.name}")
-                            except Exception as e:
-                                print(f"Warning: Could not read SVG file {svg_path}: {e}")
-                                # Keep the original path as fallback
-                        else:
-                            print(f"Warning: SVG file not found for icon: {contact['icon']}")
+            # Only icons given as file paths are embedded
+            contacts = [
+                contact for contact in cv_data['contacts']
+                if contact.get('icon') and contact['icon'].startswith(_ICON_PREFIXES)
+            ]
+            
+            # Cold icon reads block on I/O, so overlap them once there are enough to pay for
+            # the threads. Only uncached icons count, so warm batch builds never start a pool
+            cold_paths = {
+                str(svg_path) for svg_path in (self._icon_index.get(Path(contact['icon']).name) for contact in contacts)
+                if svg_path is not None and str(svg_path) not in self._svg_cache
+            }
+            if len(cold_paths) >= PARALLEL_ICON_THRESHOLD:
+                with ThreadPoolExecutor(max_workers=ICON_READ_WORKERS) as executor:
+                    results = list(executor.map(self._resolve_and_read, contacts))
+            else:
+                results = [self._resolve_and_read(contact) for contact in contacts]
+            
+            for contact, (svg_path, svg_content, error) in zip(contacts, results):
+                if svg_path is None:
+                    print(f"Warning: SVG file not found for icon: {contact['icon']}")
+                elif error is not None:
+                    # Keep the original path as fallback
+                    print(f"Warning: Could not read SVG file {svg_path}: {error}")
+                else:
+                    # Replace the icon path with the actual SVG content
+                    contact['icon'] = svg_content
+                    print(f"Embedded SVG icon: {svg_path.name}")
         
         return cv_data
 
@@ -233,6 +547,8 @@ Examples:
   python main.py -input=cv.json -output=my_resume.html
   python main.py -input=my_cv.json
   python main.py -output=custom_output.html
+  python main.py -input-glob="cvs/*.json" -output-name=output/cv
+  python main.py -input=my_cv.json -backend=playwright
         """
     )
     
@@ -248,6 +564,19 @@ Examples:
         help="Output filename (default: output/cv)"
     )
     
+    parser.add_argument(
+        "-input-glob",
+        default=None,
+        help="Glob pattern of input JSON files to build in one batch; each CV is "
+             "written next to -output-name using the JSON file name (e.g. output/<name>.pdf)"
+    )
+    
+    parser.add_argument(
+        "-backend",
+        default="pyppeteer",
+        choices=PDF_BACKENDS,
+        help="PDF rendering backend (default: pyppeteer)"
+    )
     
     args = parser.parse_args()
 
@@ -255,8 +584,36 @@ Examples:
     json_file = args.input
     output_file_name = args.output_name
     
-    cv_builder = SimpleJSONCV()
-    cv_builder.build_cv(json_file, output_file_name)
+    if args.input_glob:
+        json_files = sorted(glob.glob(args.input_glob))
+        if not json_files:
+            print(f"Error: No files match '{args.input_glob}'.")
+            sys.exit(1)
+        
+        # Each CV is named after its JSON file, so equal stems would overwrite each other
+        output_dir = Path(output_file_name).parent
+        outputs = [str(output_dir / Path(f).stem) for f in json_files]
+        sources = {}
+        for json_path, output in zip(json_files, outputs):
+            if output in sources:
+                print(f"Error: '{sources[output]}' and '{json_path}' would both be written to '{output}'. "
+                      "Rename one of them or use a narrower -input-glob.")
+                sys.exit(1)
+            sources[output] = json_path
+    
+    # Turn SIGTERM into a normal exit so the shared browser is still closed below
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+    
+    cv_builder = SimpleJSONCV(backend=args.backend)
+    try:
+        if args.input_glob:
+            loop = _BrowserPool.get_loop()
+            if not loop.run_until_complete(cv_builder.build_many(json_files, outputs)):
+                sys.exit(1)
+        else:
+            cv_builder.build_cv(json_file, output_file_name)
+    finally:
+        cv_builder.close()
 
 
 if __name__ == "__main__":